@@ -551,9 +551,14 @@ alias: [{title}]
                 sections = self.processor.process_content(content, file_path)
                 llm_time = time.time() - llm_start
                 
-                # Record LLM call statistics
-                cache_hit = hasattr(self.processor, 'cache') and content_hash(content) in self.processor.cache
-                self.stats.record_llm_call(llm_time, cache_hit=cache_hit)
+                # Record LLM call statistics from the processor's own
+                # account of the call (probing is_cached afterwards would
+                # always report a hit, since a live call populates the cache)
+                call_info = getattr(self.processor, 'last_call_info', None)
+                if call_info:
+                    self.stats.record_llm_call(llm_time, **call_info)
+                else:
+                    self.stats.record_llm_call(llm_time)
             
             created_files = []
             for title, body, category, tags in sections:
@@ -574,7 +579,7 @@ alias: [{title}]
                 # Record note statistics
                 word_count = len(body.split())
                 char_count = len(body)
-                self.stats.record_created_note(category=category, tags=tags, 
+                self.stats.record_created_note(category=category, tags=tags,
                                              word_count=word_count, char_count=char_count)
             
             return created_files
@@ -4,9 +4,14 @@ LLM integration for content processing
 import os
 import re
 import json
+import heapq
+import hashlib
 import logging
+import functools
 import traceback
 from datetime import datetime
+from types import MappingProxyType
+from typing import NamedTuple, Tuple
 
 from obsidian_converter.llm_providers.provider_factory import LLMProviderFactory
 from obsidian_converter.llm_providers.base import BaseLLMProvider
@@ -15,6 +20,197 @@ from obsidian_converter.utils.text import content_hash
 
 logger = logging.getLogger("obsidian_converter")
 
+# Combined pattern for link and content-format indicators so tag generation
+# scans the content once instead of running a separate search per pattern
+_TAG_SCAN_RE = re.compile(
+    r'(?P<links>https?://[^\s]+)'
+    r'|(?P<github>github\.com)'
+    r'|(?P<stackoverflow>stackoverflow\.com)'
+    r'|(?P<youtube>youtube\.com|youtu\.be)'
+    r'|(?P<dated>\d{4}-\d{2}-\d{2})'
+    r'|(?P<table>\|\s*-+\s*\|)'
+    r'|(?P<images>!\[\s*\]\()',
+    re.IGNORECASE
+)
+
+# Re-checked inside matched URLs: the links alternative consumes the
+# whole URL, so a date in its path never reaches the dated alternative
+_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+# Word tokenization for titles and the stop words filtered out of title tags
+_WORD_RE = re.compile(r'\b[a-zA-Z0-9]{3,}\b')
+_STOP_WORDS = frozenset({
+    'the', 'and', 'for', 'with', 'this', 'that', 'from', 'about', 'have', 'has', 'had',
+    'not', 'what', 'when', 'where', 'who', 'how', 'which', 'there', 'their', 'they',
+    'been', 'were', 'would', 'could', 'should', 'will', 'then', 'than', 'them', 'these'
+})
+
+
+class TitleInfo(NamedTuple):
+    """Pre-tokenized title shared between category and tag generation"""
+    raw: str
+    lower: str
+    tokens: Tuple[str, ...]
+    filtered_tokens: Tuple[str, ...]
+
+
+@functools.lru_cache(maxsize=2048)
+def _title_info_from_str(title):
+    """Lowercase and tokenize a title string once"""
+    lower = title.lower()
+    tokens = tuple(_WORD_RE.findall(lower))
+    filtered = tuple(t for t in tokens if t not in _STOP_WORDS)
+    return TitleInfo(title, lower, tokens, filtered)
+
+
+def _title_info(title):
+    """
+    Build a TitleInfo from a title, lowercasing and tokenizing it once;
+    the result is cached so category and tag generation for the same
+    note share the work
+
+    Args:
+        title: The note title, or an already-built TitleInfo
+
+    Returns:
+        A TitleInfo for the title
+    """
+    if isinstance(title, TitleInfo):
+        return title
+    return _title_info_from_str(title)
+
+
+# Immutable classification data shared by category and tag generation.
+# Hoisted to module scope (and compiled once) so per-note calls don't
+# rebuild these dicts or re-parse the patterns.
+_MAIN_CATEGORIES = MappingProxyType({
+    "Technology": ("tech", "software", "programming", "code", "app", "website", "internet", "computer",
+                   "digital", "online", "web", "development", "algorithm", "database", "server", "api",
+                   "framework", "library", "tool", "script", "system", "network", "coding", "developer",
+                   "it", "application", "browser", "cybersecurity", "cloud", "mobile", "hardware",
+                   "security", "automation", "data", "interface", "platform", "blockchain",
+                   "devops", "android", "ios", "seo", "wordpress", "domain", "github", "git"),
+
+    "Finance": ("money", "financial", "invest", "stock", "market", "crypto", "cryptocurrency", "bitcoin",
+                "ethereum", "banking", "economy", "fund", "income", "expense", "budget", "accounting",
+                "transaction", "payment", "wallet", "bank", "trading", "tax", "finance", "solana",
+                "binance", "exchange", "token", "coin", "blockchain", "defi", "nft", "mining",
+                "staking", "investment", "profit", "revenue", "asset", "liability", "capital",
+                "loan", "interest", "mortgage", "insurance", "wealth", "portfolio"),
+
+    "Personal": ("health", "life", "diary", "journal", "personal", "habit", "routine", "goal",
+                 "achievement", "hobby", "fitness", "meditation", "reflection", "self", "emotion",
+                 "feeling", "mood", "relationship", "experience", "memory", "dream", "wellness",
+                 "family", "friend", "social", "mental", "physical", "spiritual", "diet",
+                 "exercise", "mindfulness", "productivity", "sleep", "stress", "therapy",
+                 "psychology", "motivation", "happiness", "travel", "adventure", "food", "recipe"),
+
+    "Projects": ("project", "business", "work", "task", "initiative", "startup", "venture",
+                 "plan", "idea", "proposal", "collaboration", "team", "schedule", "timeline",
+                 "milestone", "deliverable", "objective", "goal", "product", "service",
+                 "management", "planning", "roadmap", "strategy", "implementation", "client",
+                 "customer", "marketing", "sales", "brand", "launch", "growth", "metric",
+                 "kpi", "agile", "sprint", "backlog", "requirement", "scope", "budget",
+                 "deadline", "progress", "status", "meeting", "workflow", "operations"),
+
+    "Knowledge": ("learn", "study", "concept", "theory", "principle", "method", "process", "discipline",
+                  "subject", "topic", "field", "course", "education", "training", "skill", "lesson",
+                  "tutorial", "guide", "manual", "explanation", "definition", "book", "article", "paper",
+                  "science", "math", "history", "philosophy", "language", "grammar", "vocabulary",
+                  "literature", "research", "analysis", "methodology", "technique", "framework",
+                  "model", "hypothesis", "experiment", "observation", "discovery", "invention",
+                  "innovation", "insight", "wisdom", "understanding", "information", "fact",
+                  "networking", "protocol", "server", "linux", "command"),
+
+    "Reference": ("reference", "guide", "manual", "documentation", "instruction", "specification",
+                  "standard", "protocol", "formula", "recipe", "template", "checklist", "directory",
+                  "index", "catalog", "dictionary", "glossary", "cheatsheet", "resource", "link",
+                  "list", "collection", "compilation", "archive", "repository", "database",
+                  "record", "document", "file", "backup", "code", "credential", "password",
+                  "contact", "address", "phone", "email", "url", "website", "account",
+                  "identifier", "serial", "key", "license", "certificate", "authorization"),
+})
+
+# Programming languages and technologies recognized in note content
+_TECH_PATTERNS = MappingProxyType({
+    'python': re.compile(r'\bpython\b'),
+    'javascript': re.compile(r'\b(javascript|js)\b'),
+    'typescript': re.compile(r'\b(typescript|ts)\b'),
+    'java': re.compile(r'\bjava\b'),
+    'c-sharp': re.compile(r'\b(c#|c-sharp|csharp)\b'),
+    'cpp': re.compile(r'\b(c\+\+|cpp)\b'),
+    'php': re.compile(r'\bphp\b'),
+    'ruby': re.compile(r'\bruby\b'),
+    'go': re.compile(r'\bgo\b'),
+    'rust': re.compile(r'\brust\b'),
+    'swift': re.compile(r'\bswift\b'),
+    'kotlin': re.compile(r'\bkotlin\b'),
+    'react': re.compile(r'\breact\b'),
+    'angular': re.compile(r'\bangular\b'),
+    'vue': re.compile(r'\bvue\b'),
+    'node': re.compile(r'\bnode\.?js\b'),
+    'docker': re.compile(r'\bdocker\b'),
+    'kubernetes': re.compile(r'\b(kubernetes|k8s)\b'),
+    'aws': re.compile(r'\baws\b'),
+    'azure': re.compile(r'\bazure\b'),
+    'gcp': re.compile(r'\b(gcp|google cloud)\b'),
+    'database': re.compile(r'\b(database|db)\b'),
+    'sql': re.compile(r'\bsql\b'),
+    'nosql': re.compile(r'\bnosql\b'),
+    'mongodb': re.compile(r'\bmongodb\b'),
+    'redis': re.compile(r'\bredis\b'),
+    'api': re.compile(r'\bapi\b'),
+    'rest': re.compile(r'\brest\b'),
+    'graphql': re.compile(r'\bgraphql\b'),
+    'blockchain': re.compile(r'\bblockchain\b'),
+    'crypto': re.compile(r'\b(crypto|cryptocurrency)\b'),
+    'ai': re.compile(r'\b(ai|artificial intelligence)\b'),
+    'ml': re.compile(r'\b(ml|machine learning)\b'),
+    'dl': re.compile(r'\b(dl|deep learning)\b'),
+})
+
+# Financial terms recognized in note content
+_FINANCE_PATTERNS = MappingProxyType({
+    'investing': re.compile(r'\binvest(ing|ment)?\b'),
+    'trading': re.compile(r'\btrad(ing|e)\b'),
+    'stocks': re.compile(r'\bstock(s)?\b'),
+    'crypto': re.compile(r'\b(crypto|cryptocurrency|bitcoin|ethereum|token)\b'),
+    'banking': re.compile(r'\bbank(ing)?\b'),
+    'budget': re.compile(r'\bbudget\b'),
+    'accounting': re.compile(r'\baccounting\b'),
+    'finance': re.compile(r'\bfinanc(e|ial)\b'),
+    'economy': re.compile(r'\beconom(y|ic)\b'),
+    'market': re.compile(r'\bmarket\b'),
+})
+
+# Domain-specific content indicators
+_DOMAIN_PATTERNS = MappingProxyType({
+    'tutorial': re.compile(r'\b(tutorial|how[-\s]to|guide)\b'),
+    'reference': re.compile(r'\b(reference|cheatsheet|documentation)\b'),
+    'concept': re.compile(r'\b(concept|theory|principle)\b'),
+    'tool': re.compile(r'\b(tool|utility|application)\b'),
+    'project': re.compile(r'\b(project|implementation)\b'),
+    'research': re.compile(r'\b(research|study|analysis)\b'),
+    'note': re.compile(r'\b(note|summary|overview)\b'),
+})
+
+
+# Deletion table stripping every ASCII byte outside [a-z0-9-]; a C-level
+# bytes.translate is much cheaper than re.sub for these short tag strings
+_TAG_ALLOWED_BYTES = frozenset(b'abcdefghijklmnopqrstuvwxyz0123456789-')
+_TAG_DELETE_BYTES = bytes(b for b in range(128) if b not in _TAG_ALLOWED_BYTES)
+
+# Maps matched group names to the tag they emit
+_TAG_SCAN_GROUPS = {
+    'links': 'links',
+    'github': 'github',
+    'stackoverflow': 'stackoverflow',
+    'youtube': 'youtube',
+    'dated': 'dated',
+    'table': 'table',
+    'images': 'images',
+}
+
 
 class ContentProcessor:
     """
@@ -55,9 +251,39 @@ class ContentProcessor:
                 kwargs['timeout'] = 300
             self.llm = LLMProviderFactory.create_provider("ollama", "mistral", **kwargs)
         
+        # Hash of the static prompt template (no content, no file context).
+        # Keying cache entries on it means a template change invalidates
+        # old responses instead of serving stale ones
+        empty_prompt = self._get_prompt("", "")
+        self.prompt_prefix_hash = content_hash(empty_prompt)
+        # Template length, for estimating prompt size on cache hits
+        # without rebuilding the full prompt
+        self._prompt_overhead = len(empty_prompt)
+
+        # Cache outcome of the most recent process_content call; the
+        # converter reads this to feed the conversion statistics
+        self.last_call_info = None
+
         if self.use_cache:
             self._load_cache()
-    
+
+    def _cache_key(self, content_key):
+        """Build the compound cache key of prompt-prefix hash + content hash"""
+        return f"{self.prompt_prefix_hash}-{content_key}"
+
+    def is_cached(self, content):
+        """
+        Check whether a cached response exists for this content
+
+        Args:
+            content: The text content to look up
+
+        Returns:
+            True if a cached response exists
+        """
+        content_key = content_hash(content)
+        return self._cache_key(content_key) in self.cache or content_key in self.cache
+
     def _load_cache(self):
         """Load cached LLM responses from file"""
         if os.path.exists(self.cache_file):
@@ -210,12 +436,21 @@ class ContentProcessor:
             List of tuples (title, body, category, tags)
         """
         content_key = content_hash(content)
-        
-        # Try to use cached response
-        if self.use_cache and content_key in self.cache:
+        cache_key = self._cache_key(content_key)
+
+        # Try to use cached response; fall back to the bare content key
+        # for caches written before the prefix-hash scheme
+        cache_hit = True
+        prefix_hit = False
+        if self.use_cache and cache_key in self.cache:
+            logger.info(f"Using cached LLM response for content")
+            result = self.cache[cache_key]
+            prefix_hit = True
+        elif self.use_cache and content_key in self.cache:
             logger.info(f"Using cached LLM response for content")
             result = self.cache[content_key]
         else:
+            cache_hit = False
             # Process with LLM
             logger.info(f"Processing content with LLM: {context_path}")
             prompt = self._get_prompt(content, context_path)
@@ -251,11 +486,21 @@ Processing error occurred: {str(e)}
             
             # Cache the response
             if self.use_cache:
-                self.cache[content_key] = result
+                self.cache[cache_key] = result
                 # Save cache periodically
                 if len(self.cache) % 10 == 0:
                     self._save_cache()
-        
+
+        # Rough ~4 chars/token estimate of prompt plus response, the
+        # same heuristic the token reports use
+        est_tokens = (self._prompt_overhead + len(content) + len(result)) // 4
+        self.last_call_info = {
+            'cache_hit': cache_hit,
+            'prefix_hit': prefix_hit,
+            'cached_tokens': est_tokens if cache_hit else 0,
+            'live_tokens': 0 if cache_hit else est_tokens,
+        }
+
         # Extract sections from the result
         return self._extract_sections(result, context_path)
     
@@ -551,7 +796,7 @@ Processing error occurred: {str(e)}
                 sections[i] = (title, content, new_category, tags)
                 
         return sections
-    
+
     def _generate_category_from_title(self, title):
         """
         Generate a category based on the title
@@ -562,233 +807,177 @@ Processing error occurred: {str(e)}
         Returns:
             A suggested category name from the restricted set of main categories
         """
-        title_lower = title.lower()
-        
-        # ONLY use these main categories for organization
-        main_categories = {
-            "Technology": ["tech", "software", "programming", "code", "app", "website", "internet", "computer", 
-                        "digital", "online", "web", "development", "algorithm", "database", "server", "api", 
-                        "framework", "library", "tool", "script", "system", "network", "coding", "developer",
-                        "it", "application", "browser", "cybersecurity", "cloud", "mobile", "hardware",
-                        "security", "automation", "data", "interface", "platform", "api", "blockchain",
-                        "devops", "android", "ios", "seo", "wordpress", "domain", "seo", "github", "git"],
-                        
-            "Finance": ["money", "financial", "invest", "stock", "market", "crypto", "cryptocurrency", "bitcoin", 
-                      "ethereum", "banking", "economy", "fund", "income", "expense", "budget", "accounting", 
-                      "transaction", "payment", "wallet", "bank", "trading", "tax", "finance", "solana",
-                      "binance", "exchange", "token", "coin", "blockchain", "defi", "nft", "mining",
-                      "staking", "investment", "profit", "revenue", "asset", "liability", "capital",
-                      "loan", "interest", "mortgage", "insurance", "wealth", "portfolio"],
-                      
-            "Personal": ["health", "life", "diary", "journal", "personal", "habit", "routine", "goal", 
-                       "achievement", "hobby", "fitness", "meditation", "reflection", "self", "emotion", 
-                       "feeling", "mood", "relationship", "experience", "memory", "dream", "wellness",
-                       "family", "friend", "social", "mental", "physical", "spiritual", "diet", 
-                       "exercise", "mindfulness", "productivity", "sleep", "stress", "therapy", 
-                       "psychology", "motivation", "happiness", "travel", "adventure", "food", "recipe"],
-                       
-            "Projects": ["project", "business", "work", "task", "initiative", "startup", "venture", 
-                       "plan", "idea", "proposal", "collaboration", "team", "schedule", "timeline", 
-                       "milestone", "deliverable", "objective", "goal", "product", "service",
-                       "management", "planning", "roadmap", "strategy", "implementation", "client",
-                       "customer", "marketing", "sales", "brand", "launch", "growth", "metric",
-                       "kpi", "agile", "sprint", "backlog", "requirement", "scope", "budget",
-                       "deadline", "progress", "status", "meeting", "workflow", "operations"],
-                       
-            "Knowledge": ["learn", "study", "concept", "theory", "principle", "method", "process", "discipline", 
-                        "subject", "topic", "field", "course", "education", "training", "skill", "lesson", 
-                        "tutorial", "guide", "manual", "explanation", "definition", "book", "article", "paper",
-                        "science", "math", "history", "philosophy", "language", "grammar", "vocabulary",
-                        "literature", "research", "analysis", "methodology", "technique", "framework",
-                        "model", "hypothesis", "experiment", "observation", "discovery", "invention",
-                        "innovation", "insight", "wisdom", "understanding", "information", "fact",
-                        "networking", "protocol", "server", "linux", "command"],
-                        
-            "Reference": ["reference", "guide", "manual", "documentation", "instruction", "specification", 
-                         "standard", "protocol", "formula", "recipe", "template", "checklist", "directory", 
-                         "index", "catalog", "dictionary", "glossary", "cheatsheet", "resource", "link",
-                         "list", "collection", "compilation", "archive", "repository", "database", 
-                         "record", "document", "file", "backup", "code", "credential", "password",
-                         "contact", "address", "phone", "email", "url", "website", "account",
-                         "identifier", "serial", "key", "license", "certificate", "authorization"]
-        }
-        
-        # Search for keywords in title
-        for category, keywords in main_categories.items():
-            for keyword in keywords:
-                if keyword in title_lower:
-                    return category
-        
-        # If no keywords match, assign to Knowledge by default
-        return "Knowledge"
-    
+        return _category_from_title(title)
+
     def _generate_tags_from_content(self, title, content):
         """
         Generate tags based on the content
-        
+
         Args:
             title: The note title
             content: The note content
-            
+
         Returns:
             A list of generated tags
         """
-        tags = []
-        
-        # Extract meaningful words from title
-        words = re.findall(r'\b[a-zA-Z0-9]{3,}\b', title.lower())
-        
-        # Filter out common stop words
-        stop_words = {'the', 'and', 'for', 'with', 'this', 'that', 'from', 'about', 'have', 'has', 'had', 
-                     'not', 'what', 'when', 'where', 'who', 'how', 'which', 'there', 'their', 'they',
-                     'been', 'were', 'would', 'could', 'should', 'will', 'then', 'than', 'them', 'these'}
-        title_tags = [word for word in words if word not in stop_words]
-        tags.extend(title_tags)
-        
-        # Add tags from common patterns in content
-        if re.search(r'```[a-zA-Z]*\n', content):
-            code_lang = re.search(r'```([a-zA-Z0-9]+)', content)
-            if code_lang and code_lang.group(1):
-                tags.append(f'{code_lang.group(1)}-code')
-            tags.append('code-snippet')
-            
-        # Extract programming languages and technologies
-        tech_patterns = {
-            'python': r'\bpython\b',
-            'javascript': r'\b(javascript|js)\b',
-            'typescript': r'\b(typescript|ts)\b',
-            'java': r'\bjava\b',
-            'c-sharp': r'\b(c#|c-sharp|csharp)\b',
-            'cpp': r'\b(c\+\+|cpp)\b',
-            'php': r'\bphp\b',
-            'ruby': r'\bruby\b',
-            'go': r'\bgo\b',
-            'rust': r'\brust\b',
-            'swift': r'\bswift\b',
-            'kotlin': r'\bkotlin\b',
-            'react': r'\breact\b',
-            'angular': r'\bangular\b',
-            'vue': r'\bvue\b',
-            'node': r'\bnode\.?js\b',
-            'docker': r'\bdocker\b',
-            'kubernetes': r'\b(kubernetes|k8s)\b',
-            'aws': r'\baws\b',
-            'azure': r'\bazure\b',
-            'gcp': r'\b(gcp|google cloud)\b',
-            'database': r'\b(database|db)\b',
-            'sql': r'\bsql\b',
-            'nosql': r'\bnosql\b',
-            'mongodb': r'\bmongodb\b',
-            'redis': r'\bredis\b',
-            'api': r'\bapi\b',
-            'rest': r'\brest\b',
-            'graphql': r'\bgraphql\b',
-            'blockchain': r'\bblockchain\b',
-            'crypto': r'\b(crypto|cryptocurrency)\b',
-            'ai': r'\b(ai|artificial intelligence)\b',
-            'ml': r'\b(ml|machine learning)\b',
-            'dl': r'\b(dl|deep learning)\b'
-        }
-        
-        for tag, pattern in tech_patterns.items():
-            if re.search(pattern, content.lower()):
-                tags.append(tag)
-                
-        # Extract financial terms
-        finance_patterns = {
-            'investing': r'\binvest(ing|ment)?\b',
-            'trading': r'\btrad(ing|e)\b',
-            'stocks': r'\bstock(s)?\b',
-            'crypto': r'\b(crypto|cryptocurrency|bitcoin|ethereum|token)\b',
-            'banking': r'\bbank(ing)?\b',
-            'budget': r'\bbudget\b',
-            'accounting': r'\baccounting\b',
-            'finance': r'\bfinanc(e|ial)\b',
-            'economy': r'\beconom(y|ic)\b',
-            'market': r'\bmarket\b'
-        }
-        
-        for tag, pattern in finance_patterns.items():
-            if re.search(pattern, content.lower()):
-                tags.append(tag)
-                
-        # Extract content format indicators
-        if re.search(r'https?://[^\s]+', content):
-            tags.append('links')
-            
-            # Check for specific sites
-            if re.search(r'github\.com', content.lower()):
-                tags.append('github')
-            if re.search(r'stackoverflow\.com', content.lower()):
-                tags.append('stackoverflow')
-            if re.search(r'youtube\.com|youtu\.be', content.lower()):
-                tags.append('youtube')
-            
-        if re.search(r'\d{4}-\d{2}-\d{2}', content):
-            tags.append('dated')
-            
-        if len(re.findall(r'^\s*-\s+', content, re.MULTILINE)) > 3:
-            tags.append('list')
-            
-        if len(re.findall(r'^\s*\d+\.\s+', content, re.MULTILINE)) > 3:
-            tags.append('numbered-list')
-            
-        if re.search(r'\|\s*-+\s*\|', content):
-            tags.append('table')
-            
-        if re.search(r'!\[\s*\]\(', content):
-            tags.append('images')
-        
-        # Look for domain-specific content
-        domains = {
-            'tutorial': r'\b(tutorial|how[-\s]to|guide)\b',
-            'reference': r'\b(reference|cheatsheet|documentation)\b',
-            'concept': r'\b(concept|theory|principle)\b',
-            'tool': r'\b(tool|utility|application)\b',
-            'project': r'\b(project|implementation)\b',
-            'research': r'\b(research|study|analysis)\b',
-            'note': r'\b(note|summary|overview)\b'
-        }
-        
-        for tag, pattern in domains.items():
-            if re.search(pattern, content.lower()):
-                tags.append(tag)
-        
-        # Convert tags to kebab-case and ensure uniqueness
-        processed_tags = []
-        for tag in tags:
-            # Convert to lowercase and replace spaces/underscores with hyphens
-            kebab_tag = tag.lower().replace(' ', '-').replace('_', '-')
-            # Remove any non-alphanumeric characters except hyphens
-            kebab_tag = re.sub(r'[^a-z0-9-]', '', kebab_tag)
-            # Ensure no consecutive hyphens
-            kebab_tag = re.sub(r'-+', '-', kebab_tag)
-            # Remove leading/trailing hyphens
-            kebab_tag = kebab_tag.strip('-')
-            
-            if kebab_tag and len(kebab_tag) > 1:  # Ensure tag is not empty and not just a single character
-                processed_tags.append(kebab_tag)
-        
-        # Remove duplicates while preserving order
-        unique_tags = []
-        for tag in processed_tags:
-            if tag not in unique_tags:
-                unique_tags.append(tag)
-        
-        # Ensure we have at least 3 tags, add generic ones if needed
-        if len(unique_tags) < 3:
-            category = self._generate_category_from_title(title)
-            if category.lower() not in unique_tags:
-                unique_tags.append(category.lower())
-            
-            if 'note' not in unique_tags:
-                unique_tags.append('note')
-                
-            if 'reference' not in unique_tags and category == 'Reference':
-                unique_tags.append('reference')
-                
-            if 'knowledge' not in unique_tags and category == 'Knowledge':
-                unique_tags.append('knowledge')
-        
-        # Limit to 10 tags, prioritizing more specific ones (usually longer)
-        return sorted(unique_tags, key=len, reverse=True)[:10]
\ No newline at end of file
+        # Key the cache on a digest so repeated runs over unchanged
+        # content skip the regex-heavy classification
+        content_key = hashlib.blake2b(content.encode('utf-8'), digest_size=16).digest()
+        return list(_tags_cached(title, content_key, content))
+
+
+def _category_from_title(title):
+    """
+    Generate a category based on the title
+
+    Args:
+        title: The note title (str or TitleInfo)
+
+    Returns:
+        A suggested category name from the restricted set of main categories
+    """
+    title_lower = _title_info(title).lower
+
+    # Search for keywords in title
+    for category, keywords in _MAIN_CATEGORIES.items():
+        for keyword in keywords:
+            if keyword in title_lower:
+                return category
+
+    # If no keywords match, assign to Knowledge by default
+    return "Knowledge"
+
+def _tags_from_content(title, content):
+    """
+    Generate tags based on the content
+
+    Args:
+        title: The note title (str or TitleInfo)
+        content: The note content
+
+    Returns:
+        A list of generated tags
+    """
+    title = _title_info(title)
+    tags = []
+
+    # Meaningful, stop-word-filtered words from the title
+    tags.extend(title.filtered_tokens)
+
+    # Add tags from common patterns in content
+    if re.search(r'```[a-zA-Z]*\n', content):
+        code_lang = re.search(r'```([a-zA-Z0-9]+)', content)
+        if code_lang and code_lang.group(1):
+            tags.append(f'{code_lang.group(1)}-code')
+        tags.append('code-snippet')
+
+    # Lowercase the content once for all the pattern scans below
+    content_lower = content.lower()
+
+    # Extract programming languages and technologies
+    for tag, pattern in _TECH_PATTERNS.items():
+        if pattern.search(content_lower):
+            tags.append(tag)
+
+    # Extract financial terms
+    for tag, pattern in _FINANCE_PATTERNS.items():
+        if pattern.search(content_lower):
+            tags.append(tag)
+
+    # Extract content format indicators in a single scan over the content
+    seen_groups = set()
+    for match in _TAG_SCAN_RE.finditer(content):
+        group = match.lastgroup
+        seen_groups.add(group)
+        if group == 'links':
+            # Site names and dates inside a URL are consumed by the
+            # links group, so check the matched URL for them directly
+            url = match.group().lower()
+            if 'github.com' in url:
+                seen_groups.add('github')
+            if 'stackoverflow.com' in url:
+                seen_groups.add('stackoverflow')
+            if 'youtube.com' in url or 'youtu.be' in url:
+                seen_groups.add('youtube')
+            if _DATE_RE.search(url):
+                seen_groups.add('dated')
+
+    # Site tags only apply when an actual URL was found
+    if 'links' not in seen_groups:
+        seen_groups -= {'github', 'stackoverflow', 'youtube'}
+
+    for group, tag in _TAG_SCAN_GROUPS.items():
+        if group in seen_groups:
+            tags.append(tag)
+
+    if len(re.findall(r'^\s*-\s+', content, re.MULTILINE)) > 3:
+        tags.append('list')
+
+    if len(re.findall(r'^\s*\d+\.\s+', content, re.MULTILINE)) > 3:
+        tags.append('numbered-list')
+
+    # Look for domain-specific content
+    for tag, pattern in _DOMAIN_PATTERNS.items():
+        if pattern.search(content_lower):
+            tags.append(tag)
+
+    # Convert tags to kebab-case and ensure uniqueness
+    processed_tags = []
+    for tag in tags:
+        # Convert to lowercase and replace spaces/underscores with hyphens
+        kebab_tag = tag.lower().replace(' ', '-').replace('_', '-')
+        # Remove any non-alphanumeric characters except hyphens
+        kebab_tag = (kebab_tag.encode('ascii', 'ignore')
+                     .translate(None, _TAG_DELETE_BYTES)
+                     .decode('ascii'))
+        # Ensure no consecutive hyphens
+        kebab_tag = re.sub(r'-+', '-', kebab_tag)
+        # Remove leading/trailing hyphens
+        kebab_tag = kebab_tag.strip('-')
+
+        if kebab_tag and len(kebab_tag) > 1:  # Ensure tag is not empty and not just a single character
+            processed_tags.append(kebab_tag)
+
+    # Remove duplicates while preserving order
+    unique_tags = []
+    for tag in processed_tags:
+        if tag not in unique_tags:
+            unique_tags.append(tag)
+
+    # Ensure we have at least 3 tags, add generic ones if needed
+    if len(unique_tags) < 3:
+        category = _category_from_title(title)
+        if category.lower() not in unique_tags:
+            unique_tags.append(category.lower())
+
+        if 'note' not in unique_tags:
+            unique_tags.append('note')
+
+        if 'reference' not in unique_tags and category == 'Reference':
+            unique_tags.append('reference')
+
+        if 'knowledge' not in unique_tags and category == 'Knowledge':
+            unique_tags.append('knowledge')
+
+    # Limit to 10 tags, prioritizing more specific ones (usually longer);
+    # nlargest is O(n log 10) vs a full O(n log n) sort
+    return heapq.nlargest(10, unique_tags, key=len)
+
+
+# Memoized tag results keyed on (title, content digest). An explicit
+# dict rather than lru_cache so the key holds the 16-byte digest, not a
+# reference to the full note body; bounded with FIFO eviction
+_TAGS_CACHE = {}
+_TAGS_CACHE_MAX = 4096
+
+
+def _tags_cached(title, content_key, content):
+    """Memoized tag generation keyed on (title, content digest)"""
+    key = (title, content_key)
+    tags = _TAGS_CACHE.get(key)
+    if tags is None:
+        if len(_TAGS_CACHE) >= _TAGS_CACHE_MAX:
+            del _TAGS_CACHE[next(iter(_TAGS_CACHE))]
+        tags = tuple(_tags_from_content(title, content))
+        _TAGS_CACHE[key] = tags
+    return tags
@@ -3,16 +3,14 @@ Anthropic LLM provider implementation
 """
 import os
 import logging
+import importlib.util
 from typing import Dict, Any, Optional, List
 
-try:
-    import anthropic
-    from anthropic import Anthropic
-    ANTHROPIC_AVAILABLE = True
-except ImportError:
-    ANTHROPIC_AVAILABLE = False
+# Check availability without importing the (heavy) package itself;
+# the actual import is deferred until a provider is instantiated
+ANTHROPIC_AVAILABLE = importlib.util.find_spec("anthropic") is not None
 
-from obsidian_converter.llm_providers.base import BaseLLMProvider
+from obsidian_converter.llm_providers.base import BaseLLMProvider, _llm_retry
 
 logger = logging.getLogger("obsidian_converter")
 
@@ -33,27 +31,30 @@ class AnthropicProvider(BaseLLMProvider):
         self.temperature = kwargs.get("temperature", 0.7)
         self.max_tokens = kwargs.get("max_tokens", 4000)
         
-        if not ANTHROPIC_AVAILABLE:
+        try:
+            from anthropic import Anthropic
+        except ImportError:
             raise ImportError("Anthropic package is not installed. Install with 'pip install anthropic'.")
-            
+
         if not self.api_key:
             raise ValueError("Anthropic API key not provided. Set ANTHROPIC_API_KEY environment variable.")
-            
+
         # Initialize client
         self.client = Anthropic(api_key=self.api_key)
     
+    @_llm_retry
     def invoke(self, prompt: str) -> str:
         """
-        Invoke the Anthropic model with a prompt
-        
+        Invoke the Anthropic model with a prompt, retrying transient failures
+
         Args:
             prompt: The prompt to send to the model
-            
+
         Returns:
             The model's response as text
-            
+
         Raises:
-            Exception: If the API call fails
+            Exception: If the API call fails after retries
         """
         try:
             # Call Anthropic API
@@ -4,6 +4,54 @@ Base LLM provider interface
 from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional
 
+import requests
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_random_exponential
+
+
+class TransientLLMError(Exception):
+    """A provider failure that is expected to clear and is worth retrying"""
+    pass
+
+
+# Transient SDK exception types are matched by name so the retry policy
+# doesn't force an import of the optional openai/anthropic packages
+_TRANSIENT_EXCEPTION_NAMES = frozenset({
+    "RateLimitError",
+    "APIConnectionError",
+    "APITimeoutError",
+    "InternalServerError",
+})
+
+# requests is a hard dependency, so its failures get real isinstance
+# checks: this covers subclasses like ReadTimeout/ConnectTimeout, which
+# are what requests.post(timeout=...) actually raises
+_TRANSIENT_EXCEPTION_TYPES = (
+    ConnectionError,
+    TimeoutError,
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+)
+
+
+def _is_transient(exc: BaseException) -> bool:
+    """Check whether an exception looks like a transient provider failure"""
+    if isinstance(exc, (TransientLLMError,) + _TRANSIENT_EXCEPTION_TYPES):
+        return True
+    # Walk the MRO so SDK subclasses of the transient errors match too
+    return any(cls.__name__ in _TRANSIENT_EXCEPTION_NAMES
+               for cls in type(exc).__mro__)
+
+
+# Shared retry policy for provider invoke methods: transient failures
+# (rate limits, connection drops, 5xx) back off exponentially instead of
+# aborting the whole conversion run
+_llm_retry = retry(
+    stop=stop_after_attempt(5),
+    wait=wait_random_exponential(min=1, max=30),
+    retry=retry_if_exception(_is_transient),
+    reraise=True,
+)
+
 
 class BaseLLMProvider(ABC):
     """Base class for LLM providers"""
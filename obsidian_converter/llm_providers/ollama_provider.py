@@ -2,42 +2,90 @@
 Ollama LLM provider implementation
 """
 import logging
+import functools
 import requests
 from typing import Dict, Any, Optional, List
 
-from obsidian_converter.llm_providers.base import BaseLLMProvider
+from obsidian_converter.llm_providers.base import BaseLLMProvider, TransientLLMError, _llm_retry
 
 logger = logging.getLogger("obsidian_converter")
 
 
+@functools.lru_cache(maxsize=4)
+def _list_models_cached(base_url):
+    """
+    List Ollama models, cached per process and keyed on the API base URL
+
+    Args:
+        base_url: Base URL of the Ollama API
+
+    Returns:
+        Dictionary of available models
+    """
+    try:
+        response = requests.get(f"{base_url}/api/tags", timeout=5)
+        if response.status_code == 200:
+            models = response.json().get("models", [])
+            return {
+                "available": [model["name"] for model in models]
+            }
+    except Exception as e:
+        logger.warning(f"Failed to get available Ollama models: {e}")
+
+    return {"available": []}
+
+
 class OllamaProvider(BaseLLMProvider):
     """LLM provider using Ollama"""
     
     def __init__(self, model_name: str, base_url: str = "http://localhost:11434", **kwargs):
         """
         Initialize the Ollama provider
-        
+
         Args:
             model_name: Name of the Ollama model to use
             base_url: Base URL for the Ollama API
-            **kwargs: Additional arguments
+            **kwargs: Additional arguments:
+                timeout: Request timeout in seconds (default 300)
+                keep_alive: How long Ollama keeps the model resident
+                    between calls (default "30m")
+                warm_start: If True, send an empty generate request at
+                    startup so the model is loaded before the first note
         """
         super().__init__(model_name)
         self.base_url = base_url.rstrip("/")
         self.timeout = kwargs.get("timeout", 300)  # Timeout in seconds (increased to 5 minutes)
-    
+        self.keep_alive = kwargs.get("keep_alive", "30m")
+        # Persistent session so batch runs reuse one HTTP connection
+        self.session = requests.Session()
+
+        if kwargs.get("warm_start", False):
+            self._warm_model()
+
+    def _warm_model(self):
+        """Issue an empty generate request so the model is loaded up front"""
+        try:
+            self.session.post(
+                f"{self.base_url}/api/generate",
+                json={"model": self.model_name, "keep_alive": self.keep_alive},
+                timeout=self.timeout
+            )
+        except Exception as e:
+            logger.warning(f"Failed to warm Ollama model '{self.model_name}': {e}")
+
+    @_llm_retry
     def invoke(self, prompt: str) -> str:
         """
-        Invoke the Ollama model with a prompt
-        
+        Invoke the Ollama model with a prompt, retrying transient failures
+
         Args:
             prompt: The prompt to send to the model
-            
+
         Returns:
             The model's response as text
-            
+
         Raises:
-            Exception: If the API call fails
+            Exception: If the API call fails after retries
         """
         try:
             # Prepare request payload
@@ -45,28 +93,46 @@ class OllamaProvider(BaseLLMProvider):
                 "model": self.model_name,
                 "prompt": prompt,
                 "stream": False,
+                # Keep the model resident so long conversion runs don't
+                # pay the model-load latency again between notes
+                "keep_alive": self.keep_alive,
                 "options": {
                     "temperature": 0.7
                 }
             }
-            
+
             # Call Ollama API
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/api/generate",
                 json=payload,
                 timeout=self.timeout
             )
-            
+
+            if response.status_code >= 500:
+                # Server-side errors are usually transient; retryable
+                raise TransientLLMError(f"Ollama API error: {response.status_code} - {response.text}")
             if response.status_code != 200:
                 raise Exception(f"Ollama API error: {response.status_code} - {response.text}")
-            
+
             # Parse response
             result = response.json()
             return result.get("response", "")
-            
+
         except Exception as e:
             logger.error(f"Error invoking Ollama LLM: {str(e)}")
             raise
+
+    def invoke_many(self, prompts: List[str]) -> List[str]:
+        """
+        Invoke the Ollama model with multiple prompts over one session
+
+        Args:
+            prompts: The prompts to send to the model
+
+        Returns:
+            List of model responses, in prompt order
+        """
+        return [self.invoke(prompt) for prompt in prompts]
     
     def get_provider_name(self) -> str:
         """Get the provider name"""
@@ -78,24 +144,20 @@ class OllamaProvider(BaseLLMProvider):
         return True
     
     @staticmethod
-    def get_available_models() -> Dict[str, List[str]]:
+    def get_available_models(refresh: bool = False) -> Dict[str, List[str]]:
         """
-        Get available models from Ollama
-        
+        Get available models from Ollama (cached per process)
+
+        Args:
+            refresh: If True, bypass the cache and query the API again
+
         Returns:
             Dictionary of available models
         """
-        try:
-            response = requests.get("http://localhost:11434/api/tags", timeout=5)
-            if response.status_code == 200:
-                models = response.json().get("models", [])
-                return {
-                    "available": [model["name"] for model in models]
-                }
-        except Exception as e:
-            logger.warning(f"Failed to get available Ollama models: {e}")
-        
-        return {"available": []}
+        if refresh:
+            _list_models_cached.cache_clear()
+
+        return _list_models_cached("http://localhost:11434")
     
     def validate_env(self) -> bool:
         """
@@ -111,7 +173,7 @@ class OllamaProvider(BaseLLMProvider):
                 return False
                 
             # Check if the specified model is available
-            models = self.get_available_models().get("available", [])
+            models = _list_models_cached(self.base_url).get("available", [])
             if not models or self.model_name not in models:
                 # It might still work if the model will be pulled automatically
                 logger.warning(f"Model '{self.model_name}' not found in Ollama, it will be pulled if needed")
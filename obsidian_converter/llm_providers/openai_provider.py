@@ -3,20 +3,63 @@ OpenAI LLM provider implementation
 """
 import os
 import logging
+import functools
+import importlib.util
 from typing import Dict, Any, Optional, List
 
-try:
-    import openai
-    from openai import OpenAI
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
+# Check availability without importing the (heavy) package itself;
+# the actual import is deferred until a provider is instantiated
+OPENAI_AVAILABLE = importlib.util.find_spec("openai") is not None
 
-from obsidian_converter.llm_providers.base import BaseLLMProvider
+from obsidian_converter.llm_providers.base import BaseLLMProvider, _llm_retry
 
 logger = logging.getLogger("obsidian_converter")
 
 
+@functools.lru_cache(maxsize=1)
+def _list_models_cached(api_key_hint):
+    """
+    List OpenAI models, cached per process
+
+    Args:
+        api_key_hint: Hash of the API key so key rotation invalidates the cache
+
+    Returns:
+        Dictionary of available models by category
+    """
+    api_key = os.environ.get("OPENAI_API_KEY")
+    if not api_key:
+        return {}
+
+    try:
+        from openai import OpenAI
+        client = OpenAI(api_key=api_key)
+        models = client.models.list()
+
+        # Organize models by category
+        model_dict = {
+            "gpt": [],
+            "embedding": [],
+            "other": []
+        }
+
+        for model in models.data:
+            model_id = model.id
+            if "gpt" in model_id:
+                model_dict["gpt"].append(model_id)
+            elif "embedding" in model_id or "text-embedding" in model_id:
+                model_dict["embedding"].append(model_id)
+            else:
+                model_dict["other"].append(model_id)
+
+        return model_dict
+
+    except Exception as e:
+        logger.warning(f"Failed to get available OpenAI models: {e}")
+
+    return {}
+
+
 class OpenAIProvider(BaseLLMProvider):
     """LLM provider using OpenAI API"""
     
@@ -33,27 +76,30 @@ class OpenAIProvider(BaseLLMProvider):
         self.temperature = kwargs.get("temperature", 0.7)
         self.max_tokens = kwargs.get("max_tokens")
         
-        if not OPENAI_AVAILABLE:
+        try:
+            from openai import OpenAI
+        except ImportError:
             raise ImportError("OpenAI package is not installed. Install with 'pip install openai'.")
-            
+
         if not self.api_key:
             raise ValueError("OpenAI API key not provided. Set OPENAI_API_KEY environment variable.")
-            
+
         # Initialize client
         self.client = OpenAI(api_key=self.api_key)
     
+    @_llm_retry
     def invoke(self, prompt: str) -> str:
         """
-        Invoke the OpenAI model with a prompt
-        
+        Invoke the OpenAI model with a prompt, retrying transient failures
+
         Args:
             prompt: The prompt to send to the model
-            
+
         Returns:
             The model's response as text
-            
+
         Raises:
-            Exception: If the API call fails
+            Exception: If the API call fails after retries
         """
         try:
             # Prepare completion params
@@ -86,46 +132,27 @@ class OpenAIProvider(BaseLLMProvider):
         return True
     
     @staticmethod
-    def get_available_models() -> Dict[str, List[str]]:
+    def get_available_models(refresh: bool = False) -> Dict[str, List[str]]:
         """
-        Get available models from OpenAI
-        
+        Get available models from OpenAI (cached per process)
+
+        Args:
+            refresh: If True, bypass the cache and query the API again
+
         Returns:
             Dictionary of available models by category
         """
         if not OPENAI_AVAILABLE:
             return {}
-            
+
         api_key = os.environ.get("OPENAI_API_KEY")
         if not api_key:
             return {}
-            
-        try:
-            client = OpenAI(api_key=api_key)
-            models = client.models.list()
-            
-            # Organize models by category
-            model_dict = {
-                "gpt": [],
-                "embedding": [],
-                "other": []
-            }
-            
-            for model in models.data:
-                model_id = model.id
-                if "gpt" in model_id:
-                    model_dict["gpt"].append(model_id)
-                elif "embedding" in model_id or "text-embedding" in model_id:
-                    model_dict["embedding"].append(model_id)
-                else:
-                    model_dict["other"].append(model_id)
-                    
-            return model_dict
-            
-        except Exception as e:
-            logger.warning(f"Failed to get available OpenAI models: {e}")
-            
-        return {}
+
+        if refresh:
+            _list_models_cached.cache_clear()
+
+        return _list_models_cached(hash(api_key))
     
     def validate_env(self) -> bool:
         """
@@ -3,23 +3,16 @@ LLM provider factory
 """
 import os
 import logging
+import importlib.util
 from typing import Dict, Any, Optional, List
 
 from obsidian_converter.llm_providers.base import BaseLLMProvider
 from obsidian_converter.llm_providers.ollama_provider import OllamaProvider
 
-# Import other providers conditionally to avoid hard dependencies
-try:
-    from obsidian_converter.llm_providers.openai_provider import OpenAIProvider
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
-
-try:
-    from obsidian_converter.llm_providers.anthropic_provider import AnthropicProvider
-    ANTHROPIC_AVAILABLE = True
-except ImportError:
-    ANTHROPIC_AVAILABLE = False
+# Check optional dependencies cheaply; the provider modules themselves are
+# imported lazily so unused SDKs don't slow down CLI startup
+OPENAI_AVAILABLE = importlib.util.find_spec("openai") is not None
+ANTHROPIC_AVAILABLE = importlib.util.find_spec("anthropic") is not None
 
 logger = logging.getLogger("obsidian_converter")
 
@@ -52,11 +45,13 @@ class LLMProviderFactory:
         elif provider_name == "openai":
             if not OPENAI_AVAILABLE:
                 raise ValueError("OpenAI package is not installed. Install with 'pip install openai'.")
+            from obsidian_converter.llm_providers.openai_provider import OpenAIProvider
             return OpenAIProvider(model_name, **kwargs)
-            
+
         elif provider_name == "anthropic":
             if not ANTHROPIC_AVAILABLE:
                 raise ValueError("Anthropic package is not installed. Install with 'pip install anthropic'.")
+            from obsidian_converter.llm_providers.anthropic_provider import AnthropicProvider
             return AnthropicProvider(model_name, **kwargs)
             
         else:
@@ -81,6 +76,7 @@ class LLMProviderFactory:
         
         # Check for OpenAI
         if OPENAI_AVAILABLE:
+            from obsidian_converter.llm_providers.openai_provider import OpenAIProvider
             providers["openai"] = {
                 "available": True,
                 "requires_api_key": True,
@@ -96,6 +92,7 @@ class LLMProviderFactory:
         
         # Check for Anthropic
         if ANTHROPIC_AVAILABLE:
+            from obsidian_converter.llm_providers.anthropic_provider import AnthropicProvider
             providers["anthropic"] = {
                 "available": True,
                 "requires_api_key": True,
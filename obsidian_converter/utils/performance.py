@@ -2,102 +2,341 @@
 Performance utilities for processing large files and parallel execution
 """
 import os
+import re
+import math
+import mmap
 import time
+import bisect
+import codecs
 import logging
+import functools
 import multiprocessing
-from concurrent.futures import ProcessPoolExecutor, as_completed
-from typing import List, Callable, TypeVar, Iterable, Dict, Any, Tuple, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Callable, TypeVar, Iterable, Dict, Any, Tuple, Iterator, Optional
+
+try:
+    from loky import get_reusable_executor
+    LOKY_AVAILABLE = True
+except ImportError:
+    LOKY_AVAILABLE = False
 
 logger = logging.getLogger("obsidian_converter")
 
 T = TypeVar('T')
 R = TypeVar('R')
 
+# Natural break points used when splitting text: paragraph breaks,
+# sentence ends and word boundaries
+_BREAK_RE = re.compile(r'\n\n|\. | ')
+
+# Above this size, chunked_read serves chunks straight from a memory map
+# instead of copying through a read buffer
+_MMAP_THRESHOLD = 16 * 1024 * 1024
+
 def chunked_read(file_path: str, chunk_size: int = 1000000) -> Iterator[str]:
     """
     Read a large file in chunks to avoid memory issues
-    
+
+    Reads in binary mode into a single reusable buffer and decodes with
+    an incremental decoder, avoiding TextIOWrapper's per-read overhead.
+    Universal-newline translation is applied after decode, so CRLF/CR
+    sources still normalize to \\n exactly as text mode did.
+
     Args:
-        file_path: Path to the file
+        file_path: Path to the file, or an already-open file-like object
         chunk_size: Size of each chunk in bytes
-        
+
     Yields:
         File content chunks
     """
+    # File-like objects (BytesIO, sockets, already-open files) are
+    # streamed directly without any filesystem hints
+    if hasattr(file_path, 'read'):
+        yield from _translate_newlines(_stream_read(file_path, chunk_size))
+        return
+
     file_size = os.path.getsize(file_path)
-    
-    if file_size <= chunk_size:
-        # File is small enough to read entirely
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            yield f.read()
-    else:
-        # Read file in chunks
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            chunk = f.read(chunk_size)
-            while chunk:
-                yield chunk
-                chunk = f.read(chunk_size)
+
+    # Very large files go through a memory map: pages come straight from
+    # the page cache with no intermediate buffer copy
+    if file_size > _MMAP_THRESHOLD:
+        yield from _translate_newlines(_mmap_read(file_path, chunk_size))
+        return
+
+    yield from _translate_newlines(_buffered_read(file_path, file_size, chunk_size))
+
+
+def _buffered_read(file_path: str, file_size: int, chunk_size: int) -> Iterator[str]:
+    """
+    Yield decoded chunks of a file through one reusable read buffer
+
+    Args:
+        file_path: Path to the file
+        file_size: Size of the file in bytes
+        chunk_size: Size of each chunk in bytes
+
+    Yields:
+        File content chunks
+    """
+    with open(file_path, 'rb', buffering=0) as f:
+        fd = f.fileno()
+        # Tell the kernel we read sequentially so it widens its readahead
+        # window, and drop the pages from cache once we're done
+        fadvise = getattr(os, 'posix_fadvise', None)
+        if fadvise is not None:
+            fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+        try:
+            if file_size <= chunk_size:
+                # File is small enough to read entirely
+                yield f.read().decode('utf-8', errors='ignore')
+                return
+
+            # Read file in chunks through one reusable buffer
+            decoder = codecs.getincrementaldecoder('utf-8')(errors='ignore')
+            buf = bytearray(chunk_size)
+            view = memoryview(buf)
+            while True:
+                read = f.readinto(buf)
+                if not read:
+                    break
+                text = decoder.decode(view[:read])
+                if text:
+                    yield text
+            tail = decoder.decode(b'', final=True)
+            if tail:
+                yield tail
+        finally:
+            if fadvise is not None:
+                fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+
+
+def _translate_newlines(chunks: Iterator[str]) -> Iterator[str]:
+    """
+    Apply universal-newline translation across chunk boundaries
+
+    A trailing \\r is held back until the next chunk so a CRLF pair split
+    across two chunks still collapses to a single \\n.
+
+    Args:
+        chunks: Decoded text chunks
+
+    Yields:
+        Chunks with \\r\\n and \\r translated to \\n
+    """
+    pending = ''
+    for text in chunks:
+        if pending:
+            text = pending + text
+            pending = ''
+        if text.endswith('\r'):
+            pending = '\r'
+            text = text[:-1]
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+        if text:
+            yield text
+    if pending:
+        yield '\n'
+
+def _total_input_bytes(items: Iterable[T]) -> Optional[int]:
+    """
+    Sum file sizes when every item is a path to an existing file
+
+    Args:
+        items: Items being processed
+
+    Returns:
+        Total size in bytes, or None if items aren't all file paths
+    """
+    total = 0
+    for item in items:
+        if not isinstance(item, (str, os.PathLike)):
+            return None
+        try:
+            total += os.path.getsize(item)
+        except OSError:
+            return None
+    return total
+
+
+def _invoke_safely(func: Callable[[T], R], item: T) -> Tuple[bool, Any]:
+    """
+    Call func(item) and capture any exception instead of raising
+
+    Needed because executor.map aborts the whole iteration on the first
+    worker exception; failures are reported back as values and logged in
+    the parent process.
+
+    Args:
+        func: Function to call
+        item: The item to process
+
+    Returns:
+        Tuple of (success, result-or-error-message)
+    """
+    try:
+        return True, func(item)
+    except Exception as e:
+        return False, f"Error processing item {item}: {e}"
+
+
+def _stream_read(f, chunk_size: int) -> Iterator[str]:
+    """
+    Yield decoded chunks from an open file-like object
+
+    Args:
+        f: File-like object yielding bytes or str from read()
+        chunk_size: Size of each chunk
+
+    Yields:
+        File content chunks
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='ignore')
+    while True:
+        data = f.read(chunk_size)
+        if not data:
+            break
+        if isinstance(data, str):
+            # Text-mode stream: already decoded
+            yield data
+        else:
+            text = decoder.decode(data)
+            if text:
+                yield text
+    tail = decoder.decode(b'', final=True)
+    if tail:
+        yield tail
+
+
+def _mmap_read(file_path: str, chunk_size: int) -> Iterator[str]:
+    """
+    Yield decoded chunks of a file through a memory map
+
+    Args:
+        file_path: Path to the file
+        chunk_size: Size of each chunk in bytes
+
+    Yields:
+        File content chunks
+    """
+    fd = os.open(file_path, os.O_RDONLY)
+    try:
+        mm = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+        try:
+            # Aggressive readahead, pages dropped once we move past them
+            if hasattr(mm, 'madvise'):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            decoder = codecs.getincrementaldecoder('utf-8')(errors='ignore')
+            for offset in range(0, len(mm), chunk_size):
+                text = decoder.decode(mm[offset:offset + chunk_size])
+                if text:
+                    yield text
+            tail = decoder.decode(b'', final=True)
+            if tail:
+                yield tail
+        finally:
+            mm.close()
+    finally:
+        os.close(fd)
+
 
 def execute_in_parallel(
     func: Callable[[T], R],
     items: Iterable[T],
     max_workers: int = None,
-    desc: str = "Processing"
+    desc: str = "Processing",
+    min_bytes_per_worker: int = 4_000_000
 ) -> List[R]:
     """
     Execute a function on multiple items in parallel
-    
+
     Args:
         func: Function to execute
         items: Items to process
         max_workers: Maximum number of worker processes
         desc: Description for logging
-        
+        min_bytes_per_worker: Minimum input bytes to justify spawning an
+            extra worker when items are file paths
+
     Returns:
         List of results
     """
     if max_workers is None:
         # Use CPU count but at least 2 and at most 8 workers
         max_workers = min(max(multiprocessing.cpu_count(), 2), 8)
-    
+
+    # Materialize non-sized iterables once so the same sequence is used for
+    # counting and submission (len(list(items)) used to exhaust generators)
+    if not hasattr(items, '__len__'):
+        items = list(items)
+    item_count = len(items)
+
+    # For one or two items, forking workers and pickling the payload
+    # costs more than just running inline
+    if item_count <= 2:
+        results = []
+        for item in items:
+            ok, result = _invoke_safely(func, item)
+            if ok:
+                results.append(result)
+            else:
+                logger.error(result)
+        return results
+
+    # When items are file paths, size the pool to the actual work instead of
+    # always paying the spawn/pickle cost of a full pool for tiny inputs
+    total_bytes = _total_input_bytes(items)
+    if total_bytes is not None:
+        effective = max(2, math.ceil(total_bytes / min_bytes_per_worker))
+        if effective < max_workers:
+            logger.info(
+                f"Capping workers at {effective} (was {max_workers}) "
+                f"for {total_bytes} input bytes"
+            )
+            max_workers = effective
+
     results = []
-    item_count = 0
-    try:
-        # Try to get length if possible
-        item_count = len(list(items))
-    except:
-        pass
-    
-    if item_count:
-        logger.info(f"{desc} {item_count} items with {max_workers} workers")
-    else:
-        logger.info(f"{desc} items with {max_workers} workers")
+    logger.info(f"{desc} {item_count} items with {max_workers} workers")
     
     start_time = time.time()
     
-    # Using ProcessPoolExecutor for true parallelism
-    with ProcessPoolExecutor(max_workers=max_workers) as executor:
-        # Submit all tasks
-        future_to_item = {executor.submit(func, item): item for item in items}
-        
-        completed = 0
-        # Process results as they complete
-        for future in as_completed(future_to_item):
-            item = future_to_item[future]
-            try:
-                result = future.result()
+    # Batch items per worker submission so pickling cost is amortized
+    # over whole chunks instead of paid per item
+    chunksize = max(1, item_count // (max_workers * 4))
+
+    completed = 0
+    worker = functools.partial(_invoke_safely, func)
+    if LOKY_AVAILABLE:
+        # loky's reusable executor survives across calls, so repeated
+        # batches skip the fork + module-import cold start entirely
+        executor = get_reusable_executor(max_workers=max_workers, timeout=60)
+        result_iter = executor.map(worker, items, chunksize=chunksize)
+    else:
+        executor = ProcessPoolExecutor(max_workers=max_workers)
+        result_iter = executor.map(worker, items, chunksize=chunksize)
+
+    # Throttle progress logging by time instead of item counts, so fast
+    # batches don't spam the log and huge ones still report steadily
+    next_log = time.monotonic() + 2
+    try:
+        for ok, result in result_iter:
+            completed += 1
+            if ok:
                 results.append(result)
-                completed += 1
-                
-                # Log progress
-                if item_count and completed % max(1, item_count // 10) == 0:
-                    progress = (completed / item_count) * 100
-                    elapsed = time.time() - start_time
-                    rate = completed / elapsed if elapsed > 0 else 0
-                    logger.info(f"Progress: {progress:.1f}% ({completed}/{item_count}), {rate:.2f} items/sec")
-                    
-            except Exception as e:
-                logger.error(f"Error processing item {item}: {e}")
+            else:
+                logger.error(result)
+
+            # Log progress at most every 2 seconds
+            now = time.monotonic()
+            if now >= next_log:
+                progress = (completed / item_count) * 100
+                elapsed = time.time() - start_time
+                rate = completed / elapsed if elapsed > 0 else 0
+                logger.info(f"Progress: {progress:.1f}% ({completed}/{item_count}), {rate:.2f} items/sec")
+                next_log = now + 2
+    finally:
+        if not LOKY_AVAILABLE:
+            executor.shutdown()
     
     # Log completion
     elapsed = time.time() - start_time
@@ -108,44 +347,112 @@ def execute_in_parallel(
 def split_text_by_size(text: str, max_size: int = 10000) -> List[str]:
     """
     Split large text into smaller chunks for processing
-    
+
+    Accumulates whole lines into each chunk in a single O(N) pass, so
+    chunks break at line boundaries and every byte is copied exactly
+    once. Lines longer than max_size fall back to splitting at sentence
+    and word breaks.
+
     Args:
         text: The text to split
         max_size: Maximum size in characters
-        
+
     Returns:
         List of text chunks
     """
     if len(text) <= max_size:
         return [text]
-    
+
+    chunks: List[str] = []
+    buf: List[str] = []
+    size = 0
+    for line in text.splitlines(keepends=True):
+        if len(line) > max_size:
+            # Flush what we have, then break the oversized line at
+            # natural break points
+            if buf:
+                chunks.append(''.join(buf))
+                buf = []
+                size = 0
+            chunks.extend(_split_at_breaks(line, max_size))
+        elif size + len(line) > max_size:
+            chunks.append(''.join(buf))
+            buf = [line]
+            size = len(line)
+        else:
+            buf.append(line)
+            size += len(line)
+    if buf:
+        chunks.append(''.join(buf))
+
+    return chunks
+
+
+def _split_at_breaks(text: str, max_size: int) -> List[str]:
+    """
+    Split text at paragraph, sentence or word breaks
+
+    Args:
+        text: The text to split
+        max_size: Maximum size in characters
+
+    Returns:
+        List of text chunks
+    """
+    if len(text) <= max_size:
+        return [text]
+
+    # Collect all break-point offsets in one pass over the text instead of
+    # running three rfind scans per chunk
+    para_ends: List[int] = []
+    sent_ends: List[int] = []
+    word_ends: List[int] = []
+    for match in _BREAK_RE.finditer(text):
+        separator = match.group()
+        if separator == '\n\n':
+            para_ends.append(match.end())
+        elif separator == '. ':
+            sent_ends.append(match.end())
+            word_ends.append(match.end())
+        else:
+            word_ends.append(match.end())
+
     chunks = []
     current_pos = 0
     text_len = len(text)
-    
+
     while current_pos < text_len:
         # Try to find a natural break
         chunk_end = min(current_pos + max_size, text_len)
-        
-        # If not at the end, find a good break point
+
+        # If not at the end, find a good break point past the chunk midpoint
         if chunk_end < text_len:
-            # Find the next paragraph or sentence break
-            paragraph_break = text.rfind('\n\n', current_pos, chunk_end)
-            sentence_break = text.rfind('. ', current_pos, chunk_end)
-            
-            if paragraph_break > current_pos + max_size // 2:
-                # Good paragraph break
-                chunk_end = paragraph_break + 2
-            elif sentence_break > current_pos + max_size // 2:
-                # Good sentence break
-                chunk_end = sentence_break + 2
-            else:
-                # No good break found, fall back to word boundary
-                word_break = text.rfind(' ', current_pos + max_size // 2, chunk_end)
-                if word_break > current_pos:
-                    chunk_end = word_break + 1
-        
+            midpoint = current_pos + max_size // 2
+            for break_ends in (para_ends, sent_ends, word_ends):
+                break_pos = _last_break_before(break_ends, midpoint, chunk_end)
+                if break_pos is not None:
+                    chunk_end = break_pos
+                    break
+
         chunks.append(text[current_pos:chunk_end])
         current_pos = chunk_end
-    
-    return chunks
\ No newline at end of file
+
+    return chunks
+
+
+def _last_break_before(break_ends: List[int], lower: int, upper: int) -> Optional[int]:
+    """
+    Find the largest break offset in (lower, upper], or None
+
+    Args:
+        break_ends: Sorted list of break end offsets
+        lower: Exclusive lower bound (chunk midpoint)
+        upper: Inclusive upper bound (tentative chunk end)
+
+    Returns:
+        The best break offset, or None if no break lies in range
+    """
+    idx = bisect.bisect_right(break_ends, upper) - 1
+    if idx >= 0 and break_ends[idx] > lower:
+        return break_ends[idx]
+    return None
\ No newline at end of file
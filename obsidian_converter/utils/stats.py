@@ -5,6 +5,14 @@ import os
 import time
 import json
 import logging
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+from collections import Counter
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 from pathlib import Path
@@ -24,10 +32,10 @@ class ConversionStats:
         self.failed_files = 0
         
         # Categorization
-        self.categories: Dict[str, int] = {}
+        self.categories: Counter = Counter()
         
         # Tag statistics
-        self.tags: Dict[str, int] = {}
+        self.tags: Counter = Counter()
         
         # Content statistics
         self.total_words = 0
@@ -38,6 +46,9 @@ class ConversionStats:
         self.llm_calls = 0
         self.llm_cache_hits = 0
         self.llm_cache_misses = 0
+        self.llm_prefix_hits = 0
+        self.cached_tokens = 0
+        self.live_tokens = 0
         
     def record_processed_file(self):
         """Increment processed files counter"""
@@ -58,12 +69,10 @@ class ConversionStats:
         
         # Record category
         if category:
-            self.categories[category] = self.categories.get(category, 0) + 1
+            self.categories[category] += 1
         
         # Record tags
-        if tags:
-            for tag in tags:
-                self.tags[tag] = self.tags.get(tag, 0) + 1
+        self.tags.update(tags or ())
         
         # Record content statistics
         self.total_words += word_count
@@ -73,13 +82,17 @@ class ConversionStats:
         """Increment failed files counter"""
         self.failed_files += 1
     
-    def record_llm_call(self, duration: float, cache_hit: bool = False):
+    def record_llm_call(self, duration: float, cache_hit: bool = False, prefix_hit: bool = False,
+                        cached_tokens: int = 0, live_tokens: int = 0):
         """
         Record an LLM call
         
         Args:
             duration: Duration of the call in seconds
             cache_hit: Whether the call was served from cache
+            prefix_hit: Whether the stable prompt prefix was served from cache
+            cached_tokens: Tokens covered by cached prefix/response reuse
+            live_tokens: Tokens actually sent to or generated by the model
         """
         self.llm_calls += 1
         
@@ -88,6 +101,11 @@ class ConversionStats:
         else:
             self.llm_cache_misses += 1
             self.llm_time += duration
+        
+        if prefix_hit:
+            self.llm_prefix_hits += 1
+        self.cached_tokens += cached_tokens
+        self.live_tokens += live_tokens
     
     def finish(self):
         """Mark the end of processing"""
@@ -113,6 +131,14 @@ class ConversionStats:
             return (self.llm_cache_hits / self.llm_calls) * 100
         return 0
     
+    @property
+    def token_savings_pct(self) -> float:
+        """Get the share of tokens served from cache as a percentage"""
+        total = self.cached_tokens + self.live_tokens
+        if total > 0:
+            return (self.cached_tokens / total) * 100
+        return 0
+    
     @property
     def most_common_category(self) -> Optional[str]:
         """Get the most common category"""
@@ -125,8 +151,7 @@ class ConversionStats:
         """Get the top 5 most common tags"""
         if not self.tags:
             return []
-        sorted_tags = sorted(self.tags.items(), key=lambda x: x[1], reverse=True)
-        return [tag for tag, count in sorted_tags[:5]]
+        return [tag for tag, _ in self.tags.most_common(5)]
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert stats to a dictionary"""
@@ -138,8 +163,8 @@ class ConversionStats:
             'processed_files': self.processed_files,
             'created_notes': self.created_notes,
             'failed_files': self.failed_files,
-            'categories': self.categories,
-            'tags': self.tags,
+            'categories': dict(self.categories),
+            'tags': dict(self.tags),
             'content': {
                 'total_words': self.total_words,
                 'total_characters': self.total_characters,
@@ -149,6 +174,10 @@ class ConversionStats:
                 'llm_calls': self.llm_calls,
                 'llm_cache_hits': self.llm_cache_hits,
                 'llm_cache_hit_rate': self.cache_hit_rate,
+                'llm_prefix_hits': self.llm_prefix_hits,
+                'cached_tokens': self.cached_tokens,
+                'live_tokens': self.live_tokens,
+                'token_savings_pct': self.token_savings_pct,
                 'average_llm_time': self.average_llm_time
             }
         }
@@ -170,8 +199,21 @@ class ConversionStats:
         report_path = stats_dir / f"conversion_stats_{timestamp}.json"
         
         try:
-            with open(report_path, 'w') as f:
-                json.dump(self.to_dict(), f, indent=2)
+            if ORJSON_AVAILABLE:
+                # orjson's Rust encoder is several times faster than the
+                # pure-Python indent path in the stdlib
+                data = orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+            else:
+                data = json.dumps(self.to_dict(), indent=2, sort_keys=True).encode()
+
+            # The whole report is already one bytes blob, so skip the
+            # file-object layer and issue a single write syscall; no
+            # flush/fsync since the report is advisory
+            fd = os.open(report_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, data)
+            finally:
+                os.close(fd)
             
             logger.info(f"Statistics report saved to {report_path}")
             return str(report_path)
@@ -187,7 +229,7 @@ class ConversionStats:
             f"Conversion completed in {duration_min:.2f} minutes",
             f"Processed {self.processed_files} files, created {self.created_notes} notes",
             f"Failed files: {self.failed_files}",
-            f"Top categories: {', '.join([f'{cat} ({count})' for cat, count in sorted(self.categories.items(), key=lambda x: x[1], reverse=True)[:3]])}",
+            f"Top categories: {', '.join([f'{cat} ({count})' for cat, count in self.categories.most_common(3)])}",
             f"Top tags: {', '.join(self.most_common_tags)}",
             f"Total content: {self.total_words} words, {self.total_characters} characters",
             f"LLM performance: {self.llm_calls} calls, {self.cache_hit_rate:.1f}% cache hit rate, {self.average_llm_time:.2f}s average time"
@@ -3,21 +3,44 @@ Text processing utilities
 """
 import re
 import hashlib
+import functools
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
 
+# Compiled once at import so slugify skips re's per-call cache probe.
+# Deliberately per-character (no +): collapsing separator runs would
+# rename every slug with consecutive separators and duplicate notes in
+# existing vaults
+_SLUG_RE = re.compile(r'[^\w\-]')
+
+# Frontmatter block at the start of a document, and key: value lines
+# inside it; delimiters accept CRLF line endings and keys match what a
+# split(":", 1) would have produced
+_FM_RE = re.compile(r'\A---\r?\n(.*?)\r?\n---\r?\n?(.*)', re.DOTALL)
+_KV_RE = re.compile(r'^\s*([^:\n]+?)\s*:\s*(.*)$', re.M)
+
+
+@functools.lru_cache(maxsize=2048)
 def slugify(title):
     """
     Convert a title to a URL-friendly slug
-    
+
+    Memoized: category names repeat once per note, so each unique input
+    is only slugified once.
+
     Args:
         title: The title to convert
-        
+
     Returns:
         A slug-friendly string
     """
-    return re.sub(r'[^\w\-]', '-', title.strip().lower())[:60]
+    return _SLUG_RE.sub('-', title.strip().lower())[:60]
 
 
 def create_md_filename(title, category=None):
@@ -46,14 +69,33 @@ def create_md_filename(title, category=None):
 def content_hash(content):
     """
     Create a hash of the content for caching
-    
+
+    Uses xxh3 when available (an order of magnitude faster than MD5 on
+    large notes), falling back to MD5 otherwise. These are cache keys
+    only, so no cryptographic strength is needed.
+
+    An iterable of chunks (e.g. from chunked_read) is hashed with the
+    streaming update API so large files never need a single contiguous
+    buffer in memory.
+
     Args:
-        content: The text content to hash
-        
+        content: The content to hash - str, bytes, or an iterable of
+            str/bytes chunks
+
     Returns:
-        MD5 hash of the content
+        Hex digest of the content
     """
-    return hashlib.md5(content.encode()).hexdigest()
+    hasher = xxhash.xxh3_64() if XXHASH_AVAILABLE else hashlib.md5()
+    if isinstance(content, str):
+        hasher.update(content.encode())
+    elif isinstance(content, (bytes, bytearray, memoryview)):
+        hasher.update(content)
+    else:
+        for chunk in content:
+            if isinstance(chunk, str):
+                chunk = chunk.encode()
+            hasher.update(chunk)
+    return hasher.hexdigest()
 
 
 def extract_frontmatter_and_content(markdown_text):
@@ -66,21 +108,11 @@ def extract_frontmatter_and_content(markdown_text):
     Returns:
         Tuple of (frontmatter_dict, content)
     """
-    # Split frontmatter from content
-    if markdown_text.startswith("---"):
-        parts = markdown_text.split("---", 2)
-        if len(parts) >= 3:
-            frontmatter_text = parts[1].strip()
-            content = parts[2].strip()
-            
-            # Parse frontmatter into dict
-            frontmatter = {}
-            for line in frontmatter_text.split("\n"):
-                if ":" in line:
-                    key, value = line.split(":", 1)
-                    frontmatter[key.strip()] = value.strip()
-            
-            return frontmatter, content
-    
-    # No frontmatter found
-    return {}, markdown_text
\ No newline at end of file
+    # Match the frontmatter block and the remaining content in one pass
+    match = _FM_RE.match(markdown_text)
+    if not match:
+        # No frontmatter found
+        return {}, markdown_text
+
+    frontmatter = {key: value.strip() for key, value in _KV_RE.findall(match.group(1))}
+    return frontmatter, match.group(2).strip()
\ No newline at end of file
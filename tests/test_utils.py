@@ -1,12 +1,11 @@
 """
 Tests for utility functions in ObsidianConverter
 """
-import os
-import tempfile
+import io
 import unittest
 from pathlib import Path
 
-from obsidian_converter.utils.text import slugify, content_hash
+from obsidian_converter.utils.text import slugify, content_hash, extract_frontmatter_and_content
 from obsidian_converter.utils.performance import split_text_by_size, chunked_read
 
 
@@ -34,6 +33,32 @@ class TestTextUtils(unittest.TestCase):
         content3 = "This is different content"
         self.assertNotEqual(content_hash(content1), content_hash(content3))
 
+    def test_extract_frontmatter_and_content(self):
+        """Test frontmatter extraction"""
+        frontmatter, content = extract_frontmatter_and_content(
+            "---\ntitle: X\ncategory: Knowledge\n---\nBody text"
+        )
+        self.assertEqual(frontmatter, {"title": "X", "category": "Knowledge"})
+        self.assertEqual(content, "Body text")
+
+        # CRLF documents must parse the same way
+        frontmatter, content = extract_frontmatter_and_content(
+            "---\r\ntitle: X\r\n---\r\nBody"
+        )
+        self.assertEqual(frontmatter, {"title": "X"})
+        self.assertEqual(content, "Body")
+
+        # Keys with spaces or indentation are accepted
+        frontmatter, _ = extract_frontmatter_and_content(
+            "---\n  my key: value\n---\nBody"
+        )
+        self.assertEqual(frontmatter, {"my key": "value"})
+
+        # No frontmatter: text comes back untouched
+        frontmatter, content = extract_frontmatter_and_content("Just text")
+        self.assertEqual(frontmatter, {})
+        self.assertEqual(content, "Just text")
+
 
 class TestPerformanceUtils(unittest.TestCase):
     """Test performance utility functions"""
@@ -55,29 +80,20 @@ class TestPerformanceUtils(unittest.TestCase):
     
     def test_chunked_read(self):
         """Test chunked file reading"""
-        # Create temporary file
-        with tempfile.NamedTemporaryFile(mode='w', delete=False) as temp:
-            # Write some content
-            content = "Line 1\nLine 2\nLine 3\n" * 100
-            temp.write(content)
-            temp_path = temp.name
-        
-        try:
-            # Read in chunks
-            chunks = list(chunked_read(temp_path, chunk_size=100))
-            # Should have multiple chunks
-            self.assertTrue(len(chunks) > 1)
-            
-            # Combined chunks should equal original content
-            self.assertEqual("".join(chunks), content)
-            
-            # Test with very large chunk size (should read entire file)
-            big_chunks = list(chunked_read(temp_path, chunk_size=1000000))
-            self.assertEqual(len(big_chunks), 1)
-            self.assertEqual(big_chunks[0], content)
-        finally:
-            # Clean up
-            os.unlink(temp_path)
+        content = "Line 1\nLine 2\nLine 3\n" * 100
+
+        # Read from an in-memory stream in chunks
+        chunks = list(chunked_read(io.BytesIO(content.encode()), chunk_size=100))
+        # Should have multiple chunks
+        self.assertTrue(len(chunks) > 1)
+
+        # Combined chunks should equal original content
+        self.assertEqual("".join(chunks), content)
+
+        # Test with very large chunk size (should read everything at once)
+        big_chunks = list(chunked_read(io.BytesIO(content.encode()), chunk_size=1000000))
+        self.assertEqual(len(big_chunks), 1)
+        self.assertEqual(big_chunks[0], content)
 
 
 if __name__ == "__main__":
@@ -1,34 +1,151 @@
 #!/usr/bin/env python3
+import functools
+import heapq
 import json
+import mmap
+import operator
 import os
 import re
+import sys
+import numpy as np
 import tiktoken
 from datetime import datetime
 
-def num_tokens_from_string(string, encoding_name="cl100k_base"):
-    """Returns the number of tokens in a text string."""
-    encoding = tiktoken.get_encoding(encoding_name)
-    num_tokens = len(encoding.encode(string))
-    return num_tokens
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Single encoder instance for the whole run
+_ENC = tiktoken.get_encoding("cl100k_base")
+
+# tiktoken's batch path scales near-linearly up to ~8 threads and
+# flattens beyond that; don't oversubscribe on bigger machines
+_NUM_THREADS = min(8, os.cpu_count() or 1)
+
+UNKNOWN_PROMPT = "Unknown (cached response only)"
+
+# --fast approximates counts as utf-8 bytes / 4 (cl100k averages ~4
+# bytes/token on English) and only tokenizes the biggest entries exactly
+FAST_MODE = "--fast" in sys.argv
+FAST_EXACT_CANDIDATES = 50
+
+# --no-top10 keeps only running totals and skips per-entry bookkeeping,
+# for summary-only runs over huge caches; it implies exact counts
+NO_TOP10 = "--no-top10" in sys.argv
+if NO_TOP10:
+    FAST_MODE = False
+
+# How many entries to buffer before tokenizing them as one batch when
+# streaming the cache file
+BATCH_SIZE = 1024
+
+# Above this size, the whole-file parse path maps the cache instead of
+# reading it, so orjson parses straight out of the page cache with no
+# file-sized bytes copy
+_MMAP_PARSE_THRESHOLD = 100 * 1024 * 1024
+
+# Row templates for the top-10 table, bound once so the format spec is
+# parsed a single time instead of per row
+_ROW_FMT = "{preview:<55} {input_tokens:<10} {output_tokens:<10} {total_tokens:<10}\n".format
+_ROW_FMT_OUTPUT_ONLY = "{preview:<55} {output_tokens:<15}\n".format
+
+@functools.lru_cache(maxsize=None)
+def num_tokens_from_string(string):
+    """Returns the number of tokens in a text string (memoized)."""
+    # Short status strings are dominated by FFI overhead, not BPE work;
+    # approximate them instead of crossing into Rust. ASCII averages ~3
+    # chars/token under cl100k; non-ASCII (CJK, emoji) runs much denser,
+    # close to a token per character
+    if len(string) < 16:
+        if string.isascii():
+            return (len(string) + 2) // 3
+        return len(string)
+    # encode_ordinary skips the special-token scan; cached prompts and
+    # responses never contain special tokens
+    return len(_ENC.encode_ordinary(string))
 
 def format_number(num):
     """Format number with commas as thousands separator"""
     return f"{num:,}"
 
+def _normalize_entry(value):
+    """Return (prompt, response) for either cache value shape."""
+    if isinstance(value, str):
+        # The value is directly the response string
+        return UNKNOWN_PROMPT, value
+    # The value is a dictionary with prompt and response
+    return value.get("prompt", ""), value.get("response", "")
+
+def _iter_cache_entries(path):
+    """
+    Yield (key, prompt, response) triples from the cache file.
+
+    Streams key/value pairs with ijson when it is installed, so the
+    whole cache never has to sit in memory at once; otherwise parses
+    the whole file with orjson (SIMD-accelerated, 2-3x faster than the
+    stdlib on string-heavy objects), falling back to plain json.
+    """
+    if IJSON_AVAILABLE:
+        with open(path, "rb") as f:
+            for key, value in ijson.kvitems(f, ""):
+                prompt, response = _normalize_entry(value)
+                yield key, prompt, response
+    else:
+        if ORJSON_AVAILABLE and os.path.getsize(path) > _MMAP_PARSE_THRESHOLD:
+            # orjson parses zero-copy from a memoryview over the mapping
+            # (stdlib json would copy the whole buffer anyway)
+            with open(path, "rb") as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                    memoryview(mm) as view:
+                cache = orjson.loads(view)
+        else:
+            with open(path, "rb") as f:
+                raw = f.read()
+            cache = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+        # Lift legacy string values to the dict shape once, then extract
+        # both fields per entry through an itemgetter map: the whole
+        # iteration runs as a C-level loop with no per-entry .get calls
+        values = [v if isinstance(v, dict)
+                  else {"prompt": UNKNOWN_PROMPT, "response": v}
+                  for v in cache.values()]
+        get_pr = operator.itemgetter("prompt", "response")
+        for key, (prompt, response) in zip(cache, map(get_pr, values)):
+            yield key, prompt, response
+
+# Status lines are buffered and emitted as one write syscall instead of
+# a lock-and-flush per print; under remote-logged stdout each flush has
+# real cost
+_STATUS = []
+
+def _flush_status():
+    """Emit all buffered status lines with a single stdout write."""
+    if _STATUS:
+        sys.stdout.write("\n".join(_STATUS) + "\n")
+        sys.stdout.flush()
+        _STATUS.clear()
+
 # Load the cache file
 cache_file = ".llm_cache.json"
 
-print(f"Loading cache from {cache_file}...")
+_STATUS.append(f"Loading cache from {cache_file}...")
 if not os.path.exists(cache_file):
-    print(f"Error: Cache file {cache_file} not found")
+    _STATUS.append(f"Error: Cache file {cache_file} not found")
+    _flush_status()
     exit(1)
 
-with open(cache_file, "r", encoding="utf-8") as f:
-    try:
-        cache = json.load(f)
-    except json.JSONDecodeError:
-        print(f"Error: Could not parse {cache_file} as JSON")
-        exit(1)
+_PARSE_ERRORS = (json.JSONDecodeError,)
+if IJSON_AVAILABLE:
+    _PARSE_ERRORS = _PARSE_ERRORS + (ijson.JSONError,)
+if ORJSON_AVAILABLE:
+    _PARSE_ERRORS = _PARSE_ERRORS + (orjson.JSONDecodeError,)
 
 # Initialize counters
 total_prompts = 0
@@ -41,65 +158,168 @@ longest_prompt_key = ""
 longest_response_key = ""
 
 # Calculate tokens for each cache entry
-print("Calculating token usage...")
-entries = []
-for key, value in cache.items():
-    # Handle the case where the value is directly the response string
-    if isinstance(value, str):
-        prompt = "Unknown (cached response only)"
-        response = value
-        prompt_tokens = 0  # We don't have the original prompt
+_STATUS.append("Calculating token usage...")
+
+keys = []
+prompt_previews = []
+prompt_counts = []
+response_counts = []
+
+# Texts waiting for the next batched tokenization. Prompt and response
+# are interleaved in one buffer (prompt at 2j, response at 2j+1) so the
+# flush hands the list to tiktoken as-is, with no concatenation copy;
+# tiktoken's public batch API only takes str, so this is as close to
+# zero marshalling as the binding allows
+_buf_keys = []
+_buf_texts = []
+
+def _flush_buffer():
+    """Tokenize the buffered texts as one batch and record their counts."""
+    global total_prompts, total_input_tokens, total_output_tokens
+    global longest_prompt, longest_prompt_key, longest_response, longest_response_key
+    if not _buf_texts:
+        return
+    n = len(_buf_texts) // 2
+    tokens = _ENC.encode_ordinary_batch(_buf_texts, num_threads=_NUM_THREADS)
+    if NO_TOP10:
+        # Fold the batch straight into the running aggregates; nothing
+        # per-entry survives the flush
+        total_prompts += n
+        for j in range(n):
+            prompt_tokens = len(tokens[2 * j])
+            response_tokens = len(tokens[2 * j + 1])
+            total_input_tokens += prompt_tokens
+            total_output_tokens += response_tokens
+            if prompt_tokens > longest_prompt:
+                longest_prompt = prompt_tokens
+                longest_prompt_key = _buf_keys[j]
+            if response_tokens > longest_response:
+                longest_response = response_tokens
+                longest_response_key = _buf_keys[j]
     else:
-        # Handle the case where value is a dictionary with prompt and response
-        prompt = value.get("prompt", "")
-        response = value.get("response", "")
-    
-    prompt_tokens = num_tokens_from_string(prompt) if prompt != "Unknown (cached response only)" else 0
-    response_tokens = num_tokens_from_string(response)
-    
-    if prompt_tokens > longest_prompt:
-        longest_prompt = prompt_tokens
-        longest_prompt_key = key
-        
-    if response_tokens > longest_response:
-        longest_response = response_tokens
-        longest_response_key = key
-    
-    # Extract the first 50 characters of the prompt for identification
-    if prompt != "Unknown (cached response only)":
-        prompt_preview = prompt[:50].replace('\n', ' ') + "..."
+        prompt_counts.extend(len(tokens[2 * j]) for j in range(n))
+        response_counts.extend(len(tokens[2 * j + 1]) for j in range(n))
+    _buf_keys.clear()
+    _buf_texts.clear()
+
+# In fast mode only the biggest entries keep their texts around, in a
+# bounded min-heap of (approx_total, index, prompt_text, response)
+candidate_heap = []
+
+try:
+    for key, prompt, response in _iter_cache_entries(cache_file):
+        if NO_TOP10:
+            _buf_keys.append(key)
+            _buf_texts.append(prompt if prompt != UNKNOWN_PROMPT else "")
+            _buf_texts.append(response)
+            if len(_buf_texts) >= 2 * BATCH_SIZE:
+                _flush_buffer()
+            continue
+
+        index = len(keys)
+        keys.append(key)
+
+        # Extract the first 50 characters of the prompt for identification;
+        # unknown prompts tokenize as empty so they count 0 tokens
+        if prompt != UNKNOWN_PROMPT:
+            prompt_previews.append(prompt[:50].replace('\n', ' ') + "...")
+            prompt_text = prompt
+        else:
+            prompt_previews.append(UNKNOWN_PROMPT)
+            prompt_text = ""
+
+        if FAST_MODE:
+            prompt_approx = len(prompt_text.encode("utf-8")) // 4
+            response_approx = len(response.encode("utf-8")) // 4
+            prompt_counts.append(prompt_approx)
+            response_counts.append(response_approx)
+            item = (prompt_approx + response_approx, index, prompt_text, response)
+            if len(candidate_heap) < FAST_EXACT_CANDIDATES:
+                heapq.heappush(candidate_heap, item)
+            else:
+                heapq.heappushpop(candidate_heap, item)
+        else:
+            _buf_texts.append(prompt_text)
+            _buf_texts.append(response)
+            if len(_buf_texts) >= 2 * BATCH_SIZE:
+                _flush_buffer()
+    _flush_buffer()
+except _PARSE_ERRORS:
+    _STATUS.append(f"Error: Could not parse {cache_file} as JSON")
+    _flush_status()
+    exit(1)
+
+entry_count = len(keys)
+
+if FAST_MODE and candidate_heap:
+    # Tokenize the retained candidates exactly (they are the ones the
+    # top-10 table prints)
+    candidates = [(index, p, r) for _, index, p, r in candidate_heap]
+    candidate_tokens = _ENC.encode_ordinary_batch(
+        [p for _, p, _ in candidates] + [r for _, _, r in candidates],
+        num_threads=_NUM_THREADS)
+
+    approx_sample = sum(prompt_counts[i] + response_counts[i] for i, _, _ in candidates)
+    for j, (i, _, _) in enumerate(candidates):
+        prompt_counts[i] = len(candidate_tokens[j])
+        response_counts[i] = len(candidate_tokens[len(candidates) + j])
+    exact_sample = sum(len(t) for t in candidate_tokens)
+
+    # Rescale the remaining approximations by the exact/approx ratio
+    # observed on the sample so the grand totals stay close
+    if approx_sample > 0:
+        scale = exact_sample / approx_sample
+        candidate_set = {i for i, _, _ in candidates}
+        for i in range(entry_count):
+            if i not in candidate_set:
+                prompt_counts[i] = round(prompt_counts[i] * scale)
+                response_counts[i] = round(response_counts[i] * scale)
+
+if NO_TOP10:
+    # Aggregates were folded in during the flushes
+    total_tokens = total_input_tokens + total_output_tokens
+else:
+    # Columnar bookkeeping: two int32 arrays instead of one dict per entry,
+    # so aggregates and the top-10 ranking run as numpy reductions
+    input_toks = np.asarray(prompt_counts, dtype=np.int32)
+    output_toks = np.asarray(response_counts, dtype=np.int32)
+    entry_totals = input_toks + output_toks
+
+    total_prompts = entry_count
+    total_input_tokens = int(input_toks.sum())
+    total_output_tokens = int(output_toks.sum())
+    total_tokens = total_input_tokens + total_output_tokens
+
+    if entry_count > 0:
+        longest_prompt = int(input_toks.max())
+        longest_prompt_key = keys[int(input_toks.argmax())]
+        longest_response = int(output_toks.max())
+        longest_response_key = keys[int(output_toks.argmax())]
+
+    # Only ten entries are ever printed, so select them with an O(N)
+    # partition and sort just the winners instead of ranking everything
+    if entry_count > 10:
+        top_order = np.argpartition(entry_totals, -10)[-10:]
+        top_order = top_order[np.argsort(-entry_totals[top_order])]
     else:
-        prompt_preview = "Unknown (cached response only)"
-    
-    total_prompts += 1
-    total_input_tokens += prompt_tokens
-    total_output_tokens += response_tokens
-    
-    entries.append({
-        "prompt_preview": prompt_preview,
-        "input_tokens": prompt_tokens,
-        "output_tokens": response_tokens,
-        "total_tokens": prompt_tokens + response_tokens
-    })
-
-# Sort entries by total tokens (highest first)
-entries.sort(key=lambda x: x["total_tokens"], reverse=True)
-total_tokens = total_input_tokens + total_output_tokens
+        top_order = np.argsort(entry_totals)[::-1]
 
 # Create the log file
 log_file = "details.log"
-print(f"Writing results to {log_file}...")
+_STATUS.append(f"Writing results to {log_file}...")
 
+# Build the whole report in memory and emit it with a single write
+parts = []
 with open(log_file, "w", encoding="utf-8") as f:
-    f.write(f"# ObsidianConverter LLM Token Usage Report\n")
-    f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-    
-    f.write(f"## Summary\n")
-    f.write(f"Total cached prompts/responses: {total_prompts}\n")
-    f.write(f"Total input tokens: {format_number(total_input_tokens)}\n")
-    f.write(f"Total output tokens: {format_number(total_output_tokens)}\n")
-    f.write(f"Total combined tokens: {format_number(total_tokens)}\n\n")
-    
+    parts.append(f"# ObsidianConverter LLM Token Usage Report\n")
+    parts.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+
+    parts.append(f"## Summary\n")
+    parts.append(f"Total cached prompts/responses: {total_prompts}\n")
+    parts.append(f"Total input tokens: {format_number(total_input_tokens)}\n")
+    parts.append(f"Total output tokens: {format_number(total_output_tokens)}\n")
+    parts.append(f"Total combined tokens: {format_number(total_tokens)}\n\n")
+
     # Only calculate cost if we have input tokens (i.e., if prompts were stored)
     if total_input_tokens > 0:
         # Cost estimates (using OpenAI GPT-4 rates as reference)
@@ -109,49 +329,56 @@ with open(log_file, "w", encoding="utf-8") as f:
         gpt4o_mini_output_cost = total_output_tokens * 0.0006 / 1000  # $0.0006 per 1K tokens
         total_cost = input_cost + output_cost
         gpt4o_mini_total_cost = gpt4o_mini_input_cost + gpt4o_mini_output_cost
-        
-        f.write(f"## Estimated Costs (based on GPT-4 pricing)\n")
-        f.write(f"Input cost: ${input_cost:.2f} (at $0.03 per 1K tokens)\n")
-        f.write(f"Output cost: ${output_cost:.2f} (at $0.06 per 1K tokens)\n")
-        f.write(f"Total cost: ${total_cost:.2f}\n\n")
-        
-        f.write(f"## Estimated Costs (based on GPT-4o-mini pricing)\n")
-        f.write(f"Input cost: ${gpt4o_mini_input_cost:.2f} (at $0.00015 per 1K tokens)\n")
-        f.write(f"Output cost: ${gpt4o_mini_output_cost:.2f} (at $0.0006 per 1K tokens)\n")
-        f.write(f"Total cost: ${gpt4o_mini_total_cost:.2f}\n\n")
+
+        parts.append(f"## Estimated Costs (based on GPT-4 pricing)\n")
+        parts.append(f"Input cost: ${input_cost:.2f} (at $0.03 per 1K tokens)\n")
+        parts.append(f"Output cost: ${output_cost:.2f} (at $0.06 per 1K tokens)\n")
+        parts.append(f"Total cost: ${total_cost:.2f}\n\n")
+
+        parts.append(f"## Estimated Costs (based on GPT-4o-mini pricing)\n")
+        parts.append(f"Input cost: ${gpt4o_mini_input_cost:.2f} (at $0.00015 per 1K tokens)\n")
+        parts.append(f"Output cost: ${gpt4o_mini_output_cost:.2f} (at $0.0006 per 1K tokens)\n")
+        parts.append(f"Total cost: ${gpt4o_mini_total_cost:.2f}\n\n")
     else:
         # For cache with only responses, estimate cost based on Ollama model (local)
-        f.write(f"## Estimated Costs\n")
-        f.write(f"Note: The cache only contains responses, not prompts. Cost calculations would be incomplete.\n")
-        f.write(f"For reference, if using a local model like Ollama, costs would be primarily compute resources.\n")
-        f.write(f"If using OpenAI GPT-4, output costs alone would be approximately ${total_output_tokens * 0.00006:.2f}.\n")
-        f.write(f"If using OpenAI GPT-4o-mini, output costs alone would be approximately ${total_output_tokens * 0.0006 / 1000:.2f}.\n\n")
-    
-    f.write(f"## Response Statistics\n")
-    f.write(f"Longest response: {format_number(longest_response)} tokens\n\n")
-    
-    if total_input_tokens > 0:
-        f.write(f"Longest prompt: {format_number(longest_prompt)} tokens\n\n")
-        f.write(f"## Token Distribution\n")
-        f.write(f"Input tokens: {total_input_tokens} ({total_input_tokens/total_tokens*100:.1f}%)\n")
-        f.write(f"Output tokens: {total_output_tokens} ({total_output_tokens/total_tokens*100:.1f}%)\n")
-        f.write(f"Input/Output ratio: {total_input_tokens/total_output_tokens if total_output_tokens > 0 else 0:.2f}\n\n")
-    
-    f.write(f"## Top 10 Token-Heavy Responses\n")
+        parts.append(f"## Estimated Costs\n")
+        parts.append(f"Note: The cache only contains responses, not prompts. Cost calculations would be incomplete.\n")
+        parts.append(f"For reference, if using a local model like Ollama, costs would be primarily compute resources.\n")
+        parts.append(f"If using OpenAI GPT-4, output costs alone would be approximately ${total_output_tokens * 0.00006:.2f}.\n")
+        parts.append(f"If using OpenAI GPT-4o-mini, output costs alone would be approximately ${total_output_tokens * 0.0006 / 1000:.2f}.\n\n")
+
+    parts.append(f"## Response Statistics\n")
+    parts.append(f"Longest response: {format_number(longest_response)} tokens\n\n")
+
     if total_input_tokens > 0:
-        f.write(f"{'Prompt Preview':<55} {'Input':<10} {'Output':<10} {'Total':<10}\n")
-        f.write(f"{'-'*55} {'-'*10} {'-'*10} {'-'*10}\n")
-    else:
-        f.write(f"{'Response Preview':<55} {'Output Tokens':<15}\n")
-        f.write(f"{'-'*55} {'-'*15}\n")
-    
-    for i, entry in enumerate(entries[:10]):
+        parts.append(f"Longest prompt: {format_number(longest_prompt)} tokens\n\n")
+        parts.append(f"## Token Distribution\n")
+        parts.append(f"Input tokens: {total_input_tokens} ({total_input_tokens/total_tokens*100:.1f}%)\n")
+        parts.append(f"Output tokens: {total_output_tokens} ({total_output_tokens/total_tokens*100:.1f}%)\n")
+        parts.append(f"Input/Output ratio: {total_input_tokens/total_output_tokens if total_output_tokens > 0 else 0:.2f}\n\n")
+
+    if not NO_TOP10:
+        parts.append(f"## Top 10 Token-Heavy Responses\n")
         if total_input_tokens > 0:
-            f.write(f"{entry['prompt_preview']:<55} {entry['input_tokens']:<10} {entry['output_tokens']:<10} {entry['total_tokens']:<10}\n")
+            parts.append(f"{'Prompt Preview':<55} {'Input':<10} {'Output':<10} {'Total':<10}\n")
+            parts.append(f"{'-'*55} {'-'*10} {'-'*10} {'-'*10}\n")
         else:
-            response_preview = entry['prompt_preview'][:50] if entry['prompt_preview'] != "Unknown (cached response only)" else "Response " + str(i+1)
-            f.write(f"{response_preview:<55} {entry['output_tokens']:<15}\n")
-    
-print(f"Analysis complete!")
-print(f"Total LLM usage: {format_number(total_input_tokens)} input tokens, {format_number(total_output_tokens)} output tokens")
-print(f"Detailed report written to {log_file}")
\ No newline at end of file
+            parts.append(f"{'Response Preview':<55} {'Output Tokens':<15}\n")
+            parts.append(f"{'-'*55} {'-'*15}\n")
+
+        for rank, i in enumerate(top_order[:10]):
+            preview = prompt_previews[i]
+            if total_input_tokens > 0:
+                parts.append(_ROW_FMT(preview=preview, input_tokens=int(input_toks[i]),
+                                 output_tokens=int(output_toks[i]), total_tokens=int(entry_totals[i])))
+            else:
+                response_preview = preview[:50] if preview != UNKNOWN_PROMPT else "Response " + str(rank+1)
+                parts.append(_ROW_FMT_OUTPUT_ONLY(preview=response_preview, output_tokens=int(output_toks[i])))
+
+    # One join, one write: the whole report leaves in a single syscall
+    f.write("".join(parts))
+
+_STATUS.append("Analysis complete!")
+_STATUS.append(f"Total LLM usage: {format_number(total_input_tokens)} input tokens, {format_number(total_output_tokens)} output tokens")
+_STATUS.append(f"Detailed report written to {log_file}")
+_flush_status()